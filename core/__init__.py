@@ -9,11 +9,11 @@ from .types import (
     AccountType
 )
 from .ledger import IntelligenceCapitalLedger
-from .depreciation import calculate_depreciation
+from .depreciation import calculate_depreciation, calculate_depreciation_batch
 from .lifecycle import IntelligenceCapitalLifecycle
 from .integrity import IntegrityChecker, IntegrityError
 from .proofs import CapitalProofGenerator
-from .integration import IntegrationAdapter, ICAEAttribution
+from .integration import IntegrationAdapter, ICAEAttribution, FINANCIAL_EVENT_DTYPE
 
 __all__ = [
     "IntelligenceAsset",
@@ -26,10 +26,12 @@ __all__ = [
     "AccountType",
     "IntelligenceCapitalLedger",
     "calculate_depreciation",
+    "calculate_depreciation_batch",
     "IntelligenceCapitalLifecycle",
     "IntegrityChecker",
     "IntegrityError",
     "CapitalProofGenerator",
     "IntegrationAdapter",
-    "ICAEAttribution"
+    "ICAEAttribution",
+    "FINANCIAL_EVENT_DTYPE"
 ]
\ No newline at end of file
@@ -1,8 +1,39 @@
+import math
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Sequence, Tuple
+
+import numpy as np
 
 from .types import IntelligenceAsset, DepreciationMethod
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Integer method codes keep the compiled kernel free of enum objects
+_LINEAR = 0
+_DECLINING_BALANCE = 1
+
+_METHOD_CODES = {
+    DepreciationMethod.LINEAR: _LINEAR,
+    DepreciationMethod.DECLINING_BALANCE: _DECLINING_BALANCE,
+}
+
+
+def _method_code(method: DepreciationMethod) -> int:
+    """Map a depreciation method to its kernel code."""
+    # IntEnum members of other enums compare equal to these by value, so
+    # the type is checked before the lookup
+    method_code = _METHOD_CODES.get(method) if isinstance(method, DepreciationMethod) else None
+    if method_code is None:
+        raise ValueError(f"Unsupported depreciation method: {method}")
+    return method_code
+
 
 def calculate_depreciation(
     asset: IntelligenceAsset,
@@ -24,20 +55,130 @@ def calculate_depreciation(
     Returns:
         Tuple of (depreciated_amount, new_value)
     """
-    if asset.depreciation_method == DepreciationMethod.LINEAR:
-        return _linear_depreciation(asset, start_date, end_date, salvage_value)
-    elif asset.depreciation_method == DepreciationMethod.DECLINING_BALANCE:
-        return _declining_balance_depreciation(asset, start_date, end_date, salvage_value, rate_multiplier)
-    else:
-        raise ValueError(f"Unsupported depreciation method: {asset.depreciation_method}")
+    method_code = _method_code(asset.depreciation_method)
+    if asset.useful_life_months <= 0:
+        raise ValueError(f"Useful life must be positive for asset {asset.asset_id}")
+    
+    months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+    
+    return _depreciation_kernel(
+        method_code,
+        asset.initial_value,
+        asset.current_value or 0.0,
+        asset.useful_life_months,
+        months,
+        salvage_value,
+        rate_multiplier
+    )
 
 
-def _linear_depreciation(
-    asset: IntelligenceAsset,
+
+def calculate_depreciation_batch(
+    assets: Sequence[IntelligenceAsset],
     start_date: datetime,
     end_date: datetime,
-    salvage_value: float = 0.0
+    salvage_value: float = 0.0,
+    rate_multiplier: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate depreciation for many intelligence assets over the same period.
+    
+    Produces the same figures as calling calculate_depreciation on each asset,
+    but evaluates every asset in a single pass over columnar NumPy arrays.
+    
+    Args:
+        assets: The intelligence assets to depreciate
+        start_date: Start of the depreciation period
+        end_date: End of the depreciation period
+        salvage_value: Value remaining after full depreciation (default 0.0)
+        rate_multiplier: For declining balance method (default 2.0 for double-declining)
+    
+    Returns:
+        Tuple of (depreciated_amounts, new_values) arrays aligned with assets
+    """
+    n = len(assets)
+    method_codes = np.empty(n, dtype=np.int8)
+    for i, asset in enumerate(assets):
+        method_codes[i] = _method_code(asset.depreciation_method)
+    
+    initial = np.fromiter((a.initial_value for a in assets), dtype=np.float64, count=n)
+    current = np.fromiter((a.current_value or 0.0 for a in assets), dtype=np.float64, count=n)
+    life = np.fromiter((a.useful_life_months for a in assets), dtype=np.float64, count=n)
+    invalid = np.flatnonzero(life <= 0)
+    if len(invalid):
+        raise ValueError(f"Useful life must be positive for asset {assets[invalid[0]].asset_id}")
+    
+    # A current_value of 0.0 means the asset has not been valued yet
+    base = np.where(current != 0.0, current, initial)
+    
+    months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+    
+    if months <= 0:
+        return np.zeros(n, dtype=np.float64), base
+    
+    linear = (initial - salvage_value) * (1.0 / life) * months
+    
+    rate = rate_multiplier / life
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossover_month = np.floor(np.log(salvage_value / base) / np.log(1 - rate)) + 1
+    if salvage_value <= 0:
+        crossover_month[:] = np.inf
+    crossover_month = np.where(rate <= 0, np.inf, crossover_month)
+    crossover_month = np.where((base <= salvage_value) | (rate >= 1), 1.0, crossover_month)
+    declining = np.where(
+        months >= crossover_month,
+        base - salvage_value,
+        base * (1 - (1 - rate) ** months)
+    )
+    
+    depreciation_amounts = np.where(method_codes == _LINEAR, linear, declining)
+    new_values = np.maximum(
+        salvage_value,
+        np.where(current != 0.0, current, initial - depreciation_amounts)
+    )
+    
+    return depreciation_amounts, new_values
+
+@njit(cache=True)
+def _depreciation_kernel(
+    method_code: int,
+    initial_value: float,
+    current_value: float,
+    useful_life_months: int,
+    months: int,
+    salvage_value: float,
+    rate_multiplier: float
 ) -> Tuple[float, float]:
+    """
+    Scalar depreciation math shared by every method.
+    
+    Takes plain numbers only so it can be compiled in nopython mode.
+    A current_value of 0.0 means the asset has not been valued yet.
+    """
+    if months <= 0:
+        return 0.0, current_value or initial_value
+    
+    if method_code == _LINEAR:
+        depreciation_amount = _linear_depreciation(
+            initial_value, useful_life_months, months, salvage_value
+        )
+    else:
+        depreciation_amount = _declining_balance_depreciation(
+            current_value or initial_value, useful_life_months, months, salvage_value, rate_multiplier
+        )
+    
+    new_value = max(salvage_value, current_value or initial_value - depreciation_amount)
+    
+    return depreciation_amount, new_value
+
+
+@njit(cache=True)
+def _linear_depreciation(
+    initial_value: float,
+    useful_life_months: int,
+    months: int,
+    salvage_value: float = 0.0
+) -> float:
     """
     Calculate linear (straight-line) depreciation.
     
@@ -50,28 +191,20 @@ def _linear_depreciation(
     
     For partial periods: D_partial = D * (months / total_months)
     """
-    months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-    
-    if months <= 0:
-        return 0.0, asset.current_value or asset.initial_value
-    
     # Calculate monthly depreciation amount
-    depreciable_base = asset.initial_value - salvage_value
-    monthly_rate = 1.0 / asset.useful_life_months
-    depreciation_amount = depreciable_base * monthly_rate * months
-    
-    new_value = max(salvage_value, asset.current_value or asset.initial_value - depreciation_amount)
-    
-    return depreciation_amount, new_value
+    depreciable_base = initial_value - salvage_value
+    monthly_rate = 1.0 / useful_life_months
+    return depreciable_base * monthly_rate * months
 
 
+@njit(cache=True)
 def _declining_balance_depreciation(
-    asset: IntelligenceAsset,
-    start_date: datetime,
-    end_date: datetime,
+    current_value: float,
+    useful_life_months: int,
+    months: int,
     salvage_value: float = 0.0,
     rate_multiplier: float = 2.0
-) -> Tuple[float, float]:
+) -> float:
     """
     Calculate declining balance depreciation.
     
@@ -80,29 +213,29 @@ def _declining_balance_depreciation(
         Rate = (Rate Multiplier / Useful Life)
         Switches to straight-line when remaining value is less than straight-line amount
     
-    For partial periods: Apply rate for each month in period
+    For partial periods: Compound rate over each month in period
     """
-    months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-    
-    if months <= 0:
-        return 0.0, asset.current_value or asset.initial_value
-    
     # Calculate rate based on useful life and multiplier
-    rate = rate_multiplier / asset.useful_life_months
-    current_value = asset.current_value or asset.initial_value
-    
-    # Apply depreciation for each month
-    depreciation_amount = 0.0
-    for _ in range(months):
-        monthly_depreciation = current_value * rate
-        if current_value - monthly_depreciation < salvage_value:
-            # Switch to straight-line for final period
-            depreciation_amount += (current_value - salvage_value)
-            break
-        else:
-            depreciation_amount += monthly_depreciation
-            current_value -= monthly_depreciation
-    
-    new_value = max(salvage_value, asset.current_value or asset.initial_value - depreciation_amount)
-    
-    return depreciation_amount, new_value
\ No newline at end of file
+    rate = rate_multiplier / useful_life_months
+    
+    # Monthly compounding has the closed form V_k = V_0 * (1 - rate)^k.
+    # Once a month would take the value below salvage, the remaining
+    # depreciable base is written off for the final period.
+    if months >= _salvage_crossover_month(current_value, salvage_value, rate):
+        return current_value - salvage_value
+    return current_value * (1 - (1 - rate) ** months)
+
+
+@njit(cache=True)
+def _salvage_crossover_month(current_value: float, salvage_value: float, rate: float) -> float:
+    """
+    Find the first month in which a declining balance drops below salvage value.
+
+    Solves current_value * (1 - rate)^k < salvage_value for the smallest k.
+    Returns math.inf when the balance never crosses the salvage value.
+    """
+    if current_value <= salvage_value or rate >= 1:
+        return 1.0
+    if salvage_value <= 0 or rate <= 0:
+        return math.inf
+    return float(math.floor(math.log(salvage_value / current_value) / math.log(1 - rate)) + 1)
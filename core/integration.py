@@ -1,15 +1,28 @@
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, Optional, Sequence, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ValidationError
-from datetime import datetime
+import msgspec
+import numpy as np
+from datetime import date, datetime, time
 
+from .types import CapitalEvent
+from .ledger import _amount_as_float
 
-class ICAEAttribution(BaseModel):
+
+# Fixed-width record layout handed to financial systems in one bulk call
+FINANCIAL_EVENT_DTYPE = np.dtype([
+    ("event_id", np.uint8, 16),
+    ("asset_id", np.uint8, 16),
+    ("amount", np.float64),
+    ("timestamp", "datetime64[us]"),
+])
+
+
+class ICAEAttribution(msgspec.Struct, frozen=True):
     """Schema for ICAE attribution data."""
-    asset_id: str = Field(..., description="UUID of the intelligence asset")
-    inference_cost: float = Field(..., gt=0, description="Cost in dollars")
-    execution_time: float = Field(..., gt=0, description="Time in seconds")
+    asset_id: Annotated[str, msgspec.Meta(description="UUID of the intelligence asset")]
+    inference_cost: Annotated[float, msgspec.Meta(gt=0, description="Cost in dollars")]
+    execution_time: Annotated[float, msgspec.Meta(gt=0, description="Time in seconds")]
     timestamp: datetime
     model_version: str
 
@@ -18,38 +31,46 @@ class IntegrationAdapter:
     """Handles integration with external systems."""
 
     def __init__(self):
-        self.icae_data = {}  # Simulated ICAE data source
+        self.icae_data: Dict[Union[UUID, str], Any] = {}  # Simulated ICAE data source, keyed by asset UUID
         self.financial_systems = []  # Simulated financial systems
 
     def consume_icae_attribution(self, attribution_data: Dict[str, Any]) -> None:
         """Consume inference attribution from ICAE."""
         validated_data = {}
         for key, value in attribution_data.items():
+            key = _attribution_key(key)
             if isinstance(value, dict):
+                timestamp = value.get("timestamp")
+                if isinstance(timestamp, (str, date)):
+                    value = {**value, "timestamp": _lax_timestamp(timestamp)}
                 try:
-                    validated_data[key] = ICAEAttribution(**value)
-                except ValidationError as e:
+                    validated_data[key] = msgspec.convert(value, ICAEAttribution, strict=False)
+                except msgspec.ValidationError as e:
                     raise ValueError(f"Invalid attribution data for {key}: {e}")
             else:
                 validated_data[key] = value
         
         self.icae_data.update(validated_data)
 
-    def emit_to_financial_system(self, event) -> bool:
-        """Emit capital events to financial systems."""
-        # In a real implementation, this would integrate with actual financial systems
+    def emit_to_financial_system(self, events: Union[Sequence[CapitalEvent], np.ndarray]) -> bool:
+        """Emit a batch of capital events to financial systems."""
+        records = events if isinstance(events, np.ndarray) else _to_event_records(events)
+        if records.dtype != FINANCIAL_EVENT_DTYPE:
+            raise ValueError(f"Event records must use FINANCIAL_EVENT_DTYPE, got {records.dtype}")
+
+        # In a real implementation, this would hand the whole batch to the financial systems
         return True
 
-    def validate_attribution(self, asset_id: UUID, execution_details: Dict[str, Any]) -> bool:
+    def validate_attribution(self, asset_id: Union[UUID, str], execution_details: Dict[str, Any]) -> bool:
         """Validate that attribution exists for an execution."""
         # Check if we have sufficient attribution data
-        if not self.icae_data.get(str(asset_id)):
+        if not self.icae_data.get(_attribution_key(asset_id)):
             return False
         return True
 
-    def get_execution_attribution(self, asset_id: UUID) -> Optional[Dict[str, Any]]:
+    def get_execution_attribution(self, asset_id: Union[UUID, str]) -> Optional[Dict[str, Any]]:
         """Get attribution data for a specific execution."""
-        return self.icae_data.get(str(asset_id))
+        return self.icae_data.get(_attribution_key(asset_id))
 
     def reconcile_with_financial_systems(self) -> Dict[str, Any]:
         """Reconcile ICL data with financial systems."""
@@ -57,4 +78,40 @@ class IntegrationAdapter:
         return {
             "status": "reconciled",
             "timestamp": "2023-01-01T00:00:00Z"
-        }
\ No newline at end of file
+        }
+
+
+def _attribution_key(key: Union[UUID, str]) -> Union[UUID, str]:
+    """Key attribution data by UUID so lookups never format asset IDs as strings."""
+    if isinstance(key, str):
+        try:
+            return UUID(key)
+        except ValueError:
+            return key  # Not an asset UUID; keep the caller's key
+    return key
+
+
+def _lax_timestamp(timestamp: Union[str, date]) -> Union[str, datetime]:
+    """Widen timestamps msgspec rejects but pydantic accepted: dates and ISO strings without seconds."""
+    if isinstance(timestamp, datetime):
+        return timestamp
+    if isinstance(timestamp, date):
+        return datetime.combine(timestamp, time())
+    # Only ISO-shaped strings; all-digit strings are epoch seconds for msgspec
+    if len(timestamp) >= 10 and timestamp[4] == "-":
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+    return timestamp
+
+
+def _to_event_records(events: Sequence[CapitalEvent]) -> np.ndarray:
+    """Pack capital events into a FINANCIAL_EVENT_DTYPE record array."""
+    n = len(events)
+    records = np.empty(n, dtype=FINANCIAL_EVENT_DTYPE)
+    records["event_id"] = np.frombuffer(b"".join(e.event_id.bytes for e in events), dtype=np.uint8).reshape(n, 16)
+    records["asset_id"] = np.frombuffer(b"".join(e.asset_id.bytes for e in events), dtype=np.uint8).reshape(n, 16)
+    records["amount"] = [_amount_as_float(e.details.get("amount", 0.0)) for e in events]
+    records["timestamp"] = [e.timestamp for e in events]
+    return records
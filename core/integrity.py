@@ -1,7 +1,11 @@
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Optional
 from uuid import UUID
 
+import numpy as np
+
 from .types import (
     IntelligenceAsset,
     CapitalEvent,
@@ -54,6 +58,9 @@ class IntegrityChecker:
 
     def check_all_integrity(self) -> List[str]:
         """Run all integrity checks."""
+        if self._all_records_valid():
+            return []
+
         errors = []
 
         # Check assets
@@ -70,15 +77,50 @@ class IntegrityChecker:
             except IntegrityError as e:
                 errors.append(f"Event {event.event_id}: {str(e)}")
 
-        # Check entries
+        # Check entries against their predecessor
+        previous_entry = None
         for entry in self.ledger.entries:
             try:
-                self.validate_entry(entry)
+                if entry.asset_id not in self.ledger.assets:
+                    raise IntegrityError(f"Unknown asset {entry.asset_id}")
+                if previous_entry is not None and entry.timestamp < previous_entry.timestamp:
+                    raise IntegrityError("Ledger entries must be time-ordered")
             except IntegrityError as e:
                 errors.append(f"Entry {entry.entry_id}: {str(e)}")
+            previous_entry = entry
 
         return errors
 
+    def _all_records_valid(self) -> bool:
+        """
+        Vectorized happy-path check over the ledger's columnar arrays.
+
+        Returns False whenever any record may be invalid, including records
+        added without going through the ledger API, so that the detailed
+        per-record checks can report exactly what failed. Asset fields are
+        read live because assets stay mutable after creation.
+        """
+        ledger = self.ledger
+        assets = ledger.assets.values()
+        initial_values = np.fromiter((asset.initial_value for asset in assets), dtype=np.float64, count=len(assets))
+        useful_lives = np.fromiter((asset.useful_life_months for asset in assets), dtype=np.float64, count=len(assets))
+
+        # One amount is stored per record_event call, so a length mismatch means
+        # events or entries were added directly
+        if not len(ledger._event_amounts) == len(ledger.entries) == len(ledger.events):
+            return False
+        # Every asset with recorded events and entries must still exist
+        if not ledger._events_by_asset.keys() <= ledger.assets.keys():
+            return False
+
+        return bool(
+            np.all(initial_values > 0)
+            and np.all(useful_lives > 0)
+            and ledger._entries_ordered
+            and all(asset.owner for asset in assets)
+            and all(ledger._event_type_codes)
+        )
+
     def ensure_no_retroactive_modification(self, new_event: CapitalEvent) -> None:
         """Ensure no retroactive modification attempts."""
         # This is a simplified check - in practice, this would involve more complex logic
@@ -87,18 +129,16 @@ class IntegrityChecker:
     
     def validate_depreciation_period(self, asset_id: UUID, start: datetime, end: datetime) -> None:
         """Ensure no overlapping depreciation periods for this asset."""
-        existing_depreciations = [
-            e for e in self.ledger.get_events_for_asset(asset_id)
-            if e.event_type == "depreciation"
-        ]
-        
-        # Check for overlaps with existing depreciation periods
-        for dep_event in existing_depreciations:
-            dep_start = datetime.fromisoformat(dep_event.details["start_date"])
-            dep_end = datetime.fromisoformat(dep_event.details["end_date"])
-            
-            if start <= dep_end and end >= dep_start:
-                raise IntegrityError(
-                    f"Depreciation period {start} to {end} overlaps with existing "
-                    f"period {dep_start} to {dep_end} for asset {asset_id}"
-                )
\ No newline at end of file
+        periods = self.ledger.get_depreciation_periods_for_asset(asset_id)
+        max_ends = self.ledger._dep_max_ends_by_asset.get(asset_id, [])
+
+        # periods[:idx] start on or before `end`; one of them overlaps exactly
+        # when the latest end among them reaches `start`. The first running max
+        # to reach `start` belongs to such a period.
+        idx = bisect_right(periods, end, key=itemgetter(0))
+        if idx and max_ends[idx - 1] >= start:
+            dep_start, dep_end = periods[bisect_left(max_ends, start, 0, idx)]
+            raise IntegrityError(
+                f"Depreciation period {start} to {end} overlaps with existing "
+                f"period {dep_start} to {dep_end} for asset {asset_id}"
+            )
\ No newline at end of file
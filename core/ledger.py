@@ -1,7 +1,14 @@
-from typing import List, Optional
+import math
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 from collections import defaultdict
-from datetime import datetime
+from dataclasses import is_dataclass, replace
+from enum import IntEnum
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
 
 from .types import (
     IntelligenceAsset,
@@ -15,6 +22,59 @@ from .types import (
 )
 
 
+def _to_jsonable(obj):
+    """orjson fallback that writes ledger records with enums as their labels."""
+    if is_dataclass(obj):
+        record = {}
+        for name in type(obj).__slots__:
+            value = getattr(obj, name)
+            record[name] = value.label if isinstance(value, IntEnum) else value
+        return record
+    return str(obj)
+
+
+def _amount_as_float(amount) -> float:
+    """Read an event amount as a float, with NaN for non-numeric amounts."""
+    try:
+        return float(amount)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _as_datetime(value) -> datetime:
+    """Read a depreciation period bound, accepting the ISO strings older callers pass."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+_AUDIT_TRAIL_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class _GrowableArray:
+    """Append-only NumPy buffer that doubles its capacity when full."""
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, value) -> None:
+        if self._len == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=self._data.dtype)
+            grown[:self._len] = self._data
+            self._data = grown
+        self._data[self._len] = value
+        self._len += 1
+
+    @property
+    def values(self) -> np.ndarray:
+        """View of the appended values."""
+        return self._data[:self._len]
+
+
 class IntelligenceCapitalLedger:
     """Main ledger for tracking intelligence capital assets and events."""
 
@@ -28,7 +88,36 @@ class IntelligenceCapitalLedger:
         # Add indexes for performance
         self._events_by_asset: dict[UUID, list[CapitalEvent]] = defaultdict(list)
         self._entries_by_asset: dict[UUID, list[LedgerEntry]] = defaultdict(list)
-        self._journal_entries_by_asset: dict[UUID, list[JournalEntry]] = defaultdict(list)
+        self._entries_by_event: dict[UUID, list[LedgerEntry]] = defaultdict(list)
+        self._journal_entries_by_event: dict[UUID, list[JournalEntry]] = defaultdict(list)
+        # Sorted (start, end) epoch seconds of each asset's depreciation periods,
+        # with the running maximum of their ends aligned to them
+        self._dep_periods_by_asset: dict[UUID, list[tuple[datetime, datetime]]] = defaultdict(list)
+        self._dep_max_ends_by_asset: dict[UUID, list[datetime]] = defaultdict(list)
+        self._proofs_by_id: dict[UUID, CapitalProof] = {}
+        self._last_proof_hash_by_asset: dict[UUID, str] = {}
+        self._last_timestamp: Optional[datetime] = None
+        # Whether every recorded entry is at or after the one before it
+        self._entries_ordered = True
+
+        # Columnar copies of record fields for vectorized scans. Assets get an
+        # integer row in creation order; event columns are aligned with
+        # self.events (and, one entry per event, with self.entries).
+        self._asset_rows: dict[UUID, int] = {}
+        self._event_type_codes: dict[str, int] = {}
+        self._event_asset_rows = _GrowableArray(np.int32)
+        self._event_type_column = _GrowableArray(np.int32)
+        self._event_amounts = _GrowableArray(np.float64)
+        self._journal_amounts = _GrowableArray(np.float64)
+
+    def now(self) -> datetime:
+        """Current time, strictly later than any timestamp this ledger has handed out."""
+        timestamp = datetime.now()
+        if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+            # Same clock tick (or the clock stepped back): keep records strictly ordered
+            timestamp = self._last_timestamp + _ONE_MICROSECOND
+        self._last_timestamp = timestamp
+        return timestamp
 
     def create_asset(
         self,
@@ -48,10 +137,11 @@ class IntelligenceCapitalLedger:
             initial_value=initial_value,
             depreciation_method=depreciation_method,
             useful_life_months=useful_life_months,
-            created_at=datetime.now(),
+            created_at=self.now(),
             current_value=initial_value
         )
         self.assets[asset_id] = asset
+        self._asset_rows.setdefault(asset_id, len(self._asset_rows))
         return asset
 
     def record_event(self, event: CapitalEvent) -> None:
@@ -59,6 +149,28 @@ class IntelligenceCapitalLedger:
         if event.asset_id not in self.assets:
             raise ValueError(f"Unknown asset {event.asset_id}")
 
+        # Resolve the column value before touching any state; details may hold
+        # non-numeric amounts, which are kept on the entry but stored as NaN
+        amount = event.details.get("amount", 0.0)
+        column_amount = _amount_as_float(amount)
+
+        entries_ordered = self._entries_ordered
+        if entries_ordered and self.entries:
+            try:
+                entries_ordered = event.timestamp >= self.entries[-1].timestamp
+            except TypeError:
+                # Naive and aware timestamps; leave it to the per-record checks
+                entries_ordered = False
+
+        # Index the period first: mixing naive and aware dates raises here,
+        # before the event is recorded
+        if event.event_type == "depreciation" and "start_date" in event.details and "end_date" in event.details:
+            self._index_depreciation_period(
+                event.asset_id,
+                _as_datetime(event.details["start_date"]),
+                _as_datetime(event.details["end_date"])
+            )
+
         self.events.append(event)
         self._events_by_asset[event.asset_id].append(event)  # Index
 
@@ -68,17 +180,43 @@ class IntelligenceCapitalLedger:
             event_id=event.event_id,
             asset_id=event.asset_id,
             timestamp=event.timestamp,
-            amount=event.details.get("amount", 0.0),
+            amount=amount,
             description=event.event_type,
             metadata=event.details
         )
         self.entries.append(entry)
         self._entries_by_asset[event.asset_id].append(entry)  # Index
+        self._entries_by_event[event.event_id].append(entry)  # Index
+
+        type_code = self._event_type_codes.setdefault(event.event_type, len(self._event_type_codes))
+        # Assets placed in self.assets directly get their row on first use
+        self._event_asset_rows.append(self._asset_rows.setdefault(event.asset_id, len(self._asset_rows)))
+        self._event_type_column.append(type_code)
+        self._event_amounts.append(column_amount)
+        self._entries_ordered = entries_ordered
+
+    def _index_depreciation_period(self, asset_id: UUID, start: datetime, end: datetime) -> None:
+        """Insert a depreciation period, keeping starts sorted and the running max of ends aligned."""
+        periods = self._dep_periods_by_asset[asset_id]
+        max_ends = self._dep_max_ends_by_asset[asset_id]
+
+        # Periods may overlap or be inverted when recorded directly, so every
+        # running max from the insertion point onwards is recomputed
+        i = bisect_right(periods, (start, end))
+        running = max_ends[i - 1] if i else end
+        suffix = []
+        for _, period_end in [(start, end), *periods[i:]]:
+            running = max(running, period_end)
+            suffix.append(running)
+
+        periods.insert(i, (start, end))
+        max_ends[i:] = suffix
 
     def record_journal_entry(self, journal_entry: JournalEntry) -> None:
         """Record a double-entry journal entry."""
         self.journal_entries.append(journal_entry)
-        self._journal_entries_by_asset[journal_entry.event_id].append(journal_entry)
+        self._journal_entries_by_event[journal_entry.event_id].append(journal_entry)  # Index
+        self._journal_amounts.append(journal_entry.amount)
 
     def generate_proof(self, asset_id: UUID, event_id: Optional[UUID] = None) -> CapitalProof:
         """Generate a capital proof for an asset or specific event."""
@@ -86,73 +224,126 @@ class IntelligenceCapitalLedger:
             raise ValueError(f"Unknown asset {asset_id}")
 
         # Get the last proof for this asset to create chain
-        asset_proofs = [p for p in self.proofs if p.asset_id == asset_id]
-        previous_hash = asset_proofs[-1].proof_hash if asset_proofs else None
+        if self._proof_index_is_complete():
+            previous_hash = self._last_proof_hash_by_asset.get(asset_id)
+        else:
+            asset_proofs = [p for p in self.proofs if p.asset_id == asset_id]
+            previous_hash = asset_proofs[-1].proof_hash if asset_proofs else None
 
         asset = self.assets[asset_id]
         proof = CapitalProof(
             proof_id=uuid4(),
             asset_id=asset_id,
             event_id=event_id,
-            timestamp=datetime.now(),
+            timestamp=self.now(),
             origin="ICL",
             previous_proof_hash=previous_hash,  # Link to previous
             content={
                 "asset_id": str(asset.asset_id),
                 "owner": asset.owner,
                 "initial_value": asset.initial_value,
-                "depreciation_method": asset.depreciation_method.value,
+                "depreciation_method": asset.depreciation_method.label,
                 "useful_life_months": asset.useful_life_months,
-                "status": asset.status.value,
+                "status": asset.status.label,
                 "current_value": asset.current_value
             }
         )
-        proof.proof_hash = proof.compute_hash()
+        proof = replace(proof, proof_hash=proof.compute_hash())
         self.proofs.append(proof)
+        self._proofs_by_id[proof.proof_id] = proof  # Index
+        self._last_proof_hash_by_asset[asset_id] = proof.proof_hash
         return proof
 
+    def get_proof(self, proof_id: UUID) -> Optional[CapitalProof]:
+        """Retrieve a capital proof by ID."""
+        proof = self._proofs_by_id.get(proof_id)
+        if proof is not None and self._proof_index_is_complete():
+            return proof
+
+        # Proofs were added without generate_proof; scan them directly
+        for proof in self.proofs:
+            if proof.proof_id == proof_id:
+                return proof
+        return None
+
+    def _proof_index_is_complete(self) -> bool:
+        """Whether every proof went through generate_proof, so the proof indexes are current."""
+        return len(self._proofs_by_id) == len(self.proofs)
+
     def get_asset(self, asset_id: UUID) -> Optional[IntelligenceAsset]:
         """Retrieve an intelligence asset by ID."""
         return self.assets.get(asset_id)
 
     def get_events_for_asset(self, asset_id: UUID) -> List[CapitalEvent]:
         """Get all events associated with an asset."""
-        return self._events_by_asset[asset_id]
+        return self._events_by_asset.get(asset_id, [])
 
     def get_entries_for_asset(self, asset_id: UUID) -> List[LedgerEntry]:
         """Get all ledger entries associated with an asset."""
-        return self._entries_by_asset[asset_id]
+        return self._entries_by_asset.get(asset_id, [])
+
+    def get_entries_for_event(self, event_id: UUID) -> List[LedgerEntry]:
+        """Get all ledger entries generated by an event."""
+        if len(self._event_amounts) != len(self.entries):
+            # Entries were added without record_event; scan them directly
+            return [entry for entry in self.entries if entry.event_id == event_id]
+        return self._entries_by_event.get(event_id, [])
     
+    def get_event_amounts_for_asset(self, asset_id: UUID, event_type: Optional[str] = None) -> np.ndarray:
+        """
+        Get the amounts of an asset's events, optionally of a single event type, in record order.
+
+        Non-numeric amounts are reported as NaN.
+        """
+        row = self._asset_rows.get(asset_id)
+        if row is None or (event_type is not None and event_type not in self._event_type_codes):
+            return np.empty(0, dtype=np.float64)
+
+        mask = self._event_asset_rows.values == row
+        if event_type is not None:
+            mask &= self._event_type_column.values == self._event_type_codes[event_type]
+        return self._event_amounts.values[mask]
+
+    def get_depreciation_periods_for_asset(self, asset_id: UUID) -> List[Tuple[datetime, datetime]]:
+        """Get an asset's depreciation periods as (start, end) datetimes, sorted by start."""
+        return self._dep_periods_by_asset.get(asset_id, [])
+
     def get_journal_entries_for_asset(self, asset_id: UUID) -> List[JournalEntry]:
         """Get all journal entries associated with an asset."""
         # Get all journal entries for events related to this asset
         asset_events = self.get_events_for_asset(asset_id)
-        event_ids = {e.event_id for e in asset_events}
-        
+        if len(self._journal_amounts) != len(self.journal_entries):
+            # Entries were added without record_journal_entry; scan them directly
+            event_ids = {e.event_id for e in asset_events}
+            return [entry for entry in self.journal_entries if entry.event_id in event_ids]
+
         return [
-            entry for entry in self.journal_entries 
-            if entry.event_id in event_ids
+            entry
+            for event in asset_events
+            for entry in self._journal_entries_by_event.get(event.event_id, ())
         ]
     
     def verify_journal_balance(self) -> bool:
         """Verify that all journal entries are valid (positive amounts)."""
         # In current implementation, each JournalEntry represents a complete debit/credit pair
         # with the same amount. So we just check that amounts are positive.
-        return all(entry.amount > 0 for entry in self.journal_entries)
+        if len(self._journal_amounts) != len(self.journal_entries):
+            # Entries were added without record_journal_entry; check them directly
+            return all(entry.amount > 0 for entry in self.journal_entries)
+        return bool(np.all(self._journal_amounts.values > 0))
     
     def export_audit_trail(self, format: str = "json") -> str:
         """Export complete audit trail in specified format."""
-        import json
-        from dataclasses import asdict
-        
         if format == "json":
-            return json.dumps({
-                "assets": [asdict(a) for a in self.assets.values()],
-                "events": [asdict(e) for e in self.events],
-                "entries": [asdict(e) for e in self.entries],
-                "journal_entries": [asdict(j) for j in self.journal_entries],
-                "proofs": [asdict(p) for p in self.proofs]
-            }, default=str, indent=2)
+            # Records are flattened one level by _to_jsonable rather than deep
+            # copied with asdict; orjson encodes UUIDs and datetimes natively
+            return orjson.dumps({
+                "assets": list(self.assets.values()),
+                "events": self.events,
+                "entries": self.entries,
+                "journal_entries": self.journal_entries,
+                "proofs": self.proofs
+            }, default=_to_jsonable, option=_AUDIT_TRAIL_JSON_OPTIONS).decode()
         elif format == "csv":
             # Simple CSV export - in practice would be more complex
             return "CSV export not implemented"
\ No newline at end of file
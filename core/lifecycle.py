@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Sequence
 from uuid import UUID, uuid4
 
 from .types import (
@@ -10,7 +11,8 @@ from .types import (
     AccountType
 )
 from .ledger import IntelligenceCapitalLedger
-from .depreciation import calculate_depreciation
+from .depreciation import calculate_depreciation, calculate_depreciation_batch
+from .integrity import IntegrityChecker
 
 
 class IntelligenceCapitalLifecycle:
@@ -41,7 +43,7 @@ class IntelligenceCapitalLifecycle:
         journal_entry = JournalEntry(
             entry_id=uuid4(),
             event_id=uuid4(),  # Create a new event ID for this transaction
-            timestamp=datetime.now(),
+            timestamp=self.ledger.now(),
             debit_account=AccountType.ASSET,
             credit_account=AccountType.ACCUMULATED_DEPRECIATION,  # Simplified - in practice would be cash or equity
             amount=initial_value,
@@ -70,7 +72,7 @@ class IntelligenceCapitalLifecycle:
             event_id=uuid4(),
             asset_id=asset_id,
             event_type="allocation",
-            timestamp=datetime.now(),
+            timestamp=self.ledger.now(),
             details={
                 "from_owner": old_owner,  # Use saved old owner
                 "to_owner": target_owner
@@ -85,7 +87,7 @@ class IntelligenceCapitalLifecycle:
             event_id=uuid4(),
             asset_id=asset_id,
             event_type="utilization",
-            timestamp=datetime.now(),
+            timestamp=self.ledger.now(),
             details={"amount": amount}
         )
         self.ledger.record_event(event)
@@ -99,7 +101,6 @@ class IntelligenceCapitalLifecycle:
             raise ValueError(f"Unknown asset {asset_id}")
 
         # Validate depreciation period
-        from .integrity import IntegrityChecker
         checker = IntegrityChecker(self.ledger)
         checker.validate_depreciation_period(asset_id, start_date, end_date)
 
@@ -107,19 +108,61 @@ class IntelligenceCapitalLifecycle:
             asset, start_date, end_date, salvage_value, rate_multiplier
         )
 
+        return self._record_depreciation(
+            asset, depreciation_amount, new_value, start_date, end_date, salvage_value, rate_multiplier
+        )
+
+    def depreciate_batch(self, asset_ids: Sequence[UUID], start_date: datetime, end_date: datetime,
+                         salvage_value: float = 0.0, rate_multiplier: float = 2.0) -> List[CapitalEvent]:
+        """Apply depreciation for the same period to several assets at once."""
+        assets = []
+        for asset_id in asset_ids:
+            asset = self.ledger.get_asset(asset_id)
+            if not asset:
+                raise ValueError(f"Unknown asset {asset_id}")
+            assets.append(asset)
+
+        if len({asset.asset_id for asset in assets}) != len(assets):
+            raise ValueError("Each asset may only be depreciated once per batch")
+
+        # Validate every period before touching any asset
+        checker = IntegrityChecker(self.ledger)
+        for asset in assets:
+            checker.validate_depreciation_period(asset.asset_id, start_date, end_date)
+
+        depreciation_amounts, new_values = calculate_depreciation_batch(
+            assets, start_date, end_date, salvage_value, rate_multiplier
+        )
+
+        return [
+            self._record_depreciation(
+                asset, depreciation_amount, new_value, start_date, end_date, salvage_value, rate_multiplier
+            )
+            for asset, depreciation_amount, new_value in zip(
+                assets, depreciation_amounts.tolist(), new_values.tolist()
+            )
+        ]
+
+    def _record_depreciation(self, asset: IntelligenceAsset, depreciation_amount: float, new_value: float,
+                             start_date: datetime, end_date: datetime,
+                             salvage_value: float, rate_multiplier: float) -> CapitalEvent:
+        """Apply a calculated depreciation to an asset and record it in the ledger."""
+        asset_id = asset.asset_id
+
         # Update asset value
         previous_value = asset.current_value
         asset.current_value = new_value
 
+        now = self.ledger.now()
         event = CapitalEvent(
             event_id=uuid4(),
             asset_id=asset_id,
             event_type="depreciation",
-            timestamp=datetime.now(),
+            timestamp=now,
             details={
                 "amount": depreciation_amount,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
+                "start_date": start_date,
+                "end_date": end_date,
                 "salvage_value": salvage_value,
                 "rate_multiplier": rate_multiplier
             }
@@ -132,7 +175,7 @@ class IntelligenceCapitalLifecycle:
             journal_entry = JournalEntry(
                 entry_id=uuid4(),
                 event_id=event.event_id,
-                timestamp=datetime.now(),
+                timestamp=now,
                 debit_account=AccountType.DEPRECIATION_EXPENSE,
                 credit_account=AccountType.ACCUMULATED_DEPRECIATION,
                 amount=depreciation_amount,
@@ -157,11 +200,12 @@ class IntelligenceCapitalLifecycle:
         # Mark as retired
         asset.status = AssetStatus.RETIRED
 
+        now = self.ledger.now()
         event = CapitalEvent(
             event_id=uuid4(),
             asset_id=asset_id,
             event_type="retirement",
-            timestamp=datetime.now(),
+            timestamp=now,
             details={}
         )
         self.ledger.record_event(event)
@@ -171,7 +215,7 @@ class IntelligenceCapitalLifecycle:
             journal_entry = JournalEntry(
                 entry_id=uuid4(),
                 event_id=event.event_id,
-                timestamp=datetime.now(),
+                timestamp=now,
                 debit_account=AccountType.ACCUMULATED_DEPRECIATION,
                 credit_account=AccountType.ASSET,
                 amount=asset.current_value,
@@ -39,21 +39,16 @@ class CapitalProofGenerator:
 
     def reconstruct_proof(self, proof_id: UUID) -> Optional[CapitalProof]:
         """Reconstruct a proof from its ID."""
-        for proof in self.ledger.proofs:
-            if proof.proof_id == proof_id:
-                return proof
-        return None
+        return self.ledger.get_proof(proof_id)
 
     def get_asset_history(self, asset_id: UUID) -> List[Dict]:
         """Get the complete history of an asset."""
         events = self.ledger.get_events_for_asset(asset_id)
-        entries = self.ledger.get_entries_for_asset(asset_id)
 
-        # Fix: Use event.event_id instead of comparing to itself
         return [
             {
                 "event": e,
-                "entries": [entry for entry in entries if entry.event_id == e.event_id]
+                "entries": list(self.ledger.get_entries_for_event(e.event_id))
             }
             for e in events
         ]
\ No newline at end of file
@@ -1,28 +1,41 @@
+import hashlib
+import struct
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Dict, List, Optional, Union
 from uuid import UUID
 
+# Shared SHA-256 state primed with the proof domain tag; copied per proof
+_PROOF_HASHER = hashlib.sha256(b"ICL|CapitalProof|")
 
-class AssetStatus(str, Enum):
-    ACTIVE = "active"
-    DEPRECIATED = "depreciated"
-    RETIRED = "retired"
 
+class _LabeledIntEnum(IntEnum):
+    """Integer-valued enum that keeps a lowercase label for display and export."""
 
-class DepreciationMethod(str, Enum):
-    LINEAR = "linear"
-    DECLINING_BALANCE = "declining_balance"
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
-class AccountType(str, Enum):
-    ASSET = "asset"
-    ACCUMULATED_DEPRECIATION = "accumulated_depreciation"
-    DEPRECIATION_EXPENSE = "depreciation_expense"
+class AssetStatus(_LabeledIntEnum):
+    ACTIVE = 1
+    DEPRECIATED = 2
+    RETIRED = 3
 
 
-@dataclass
+class DepreciationMethod(_LabeledIntEnum):
+    LINEAR = 1
+    DECLINING_BALANCE = 2
+
+
+class AccountType(_LabeledIntEnum):
+    ASSET = 1
+    ACCUMULATED_DEPRECIATION = 2
+    DEPRECIATION_EXPENSE = 3
+
+
+@dataclass(slots=True)
 class IntelligenceAsset:
     """A capitalized unit of intelligence capability."""
     asset_id: UUID
@@ -35,17 +48,17 @@ class IntelligenceAsset:
     current_value: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapitalEvent:
     """A discrete economic action involving intelligence capital."""
     event_id: UUID
     asset_id: UUID
     event_type: str  # e.g., "allocation", "utilization", "depreciation"
     timestamp: datetime
-    details: Dict[str, Union[str, float, int]]
+    details: Dict[str, Union[str, float, int, datetime]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LedgerEntry:
     """An immutable, auditable economic record."""
     entry_id: UUID
@@ -54,10 +67,10 @@ class LedgerEntry:
     timestamp: datetime
     amount: float
     description: str
-    metadata: Dict[str, Union[str, int, float]]
+    metadata: Dict[str, Union[str, int, float, datetime]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JournalEntry:
     """A double-entry accounting journal entry."""
     entry_id: UUID
@@ -67,10 +80,10 @@ class JournalEntry:
     credit_account: AccountType
     amount: float
     description: str
-    metadata: Dict[str, Union[str, int, float]]
+    metadata: Dict[str, Union[str, int, float, datetime]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapitalProof:
     """A machine-verifiable explanation of how a financial figure was derived."""
     proof_id: UUID
@@ -84,8 +97,22 @@ class CapitalProof:
     
     def compute_hash(self) -> str:
         """Generate tamper-evident hash of proof content."""
-        import json
-        content_str = json.dumps(self.content, sort_keys=True)
-        hash_input = f"{self.proof_id}{self.timestamp}{content_str}{self.previous_proof_hash or ''}"
-        import hashlib
-        return hashlib.sha256(hash_input.encode()).hexdigest()
\ No newline at end of file
+        hasher = _PROOF_HASHER.copy()
+        hasher.update(self._canonical_bytes())
+        return hasher.hexdigest()
+
+    def _canonical_bytes(self) -> bytes:
+        """Serialize the hashed fields into a fixed, unambiguous byte layout."""
+        buf = bytearray(self.proof_id.bytes)
+        _pack_field(buf, self.timestamp.isoformat().encode())
+        for key in sorted(self.content):
+            _pack_field(buf, key.encode())
+            _pack_field(buf, repr(self.content[key]).encode())
+        _pack_field(buf, (self.previous_proof_hash or "").encode())
+        return bytes(buf)
+
+
+def _pack_field(buf: bytearray, data: bytes) -> None:
+    """Append a length-prefixed field so adjacent fields cannot run together."""
+    buf += struct.pack("<I", len(data))
+    buf += data
@@ -1,129 +1,116 @@
-import unittest
-from datetime import datetime, timedelta
-from uuid import uuid4
+from dataclasses import replace
+from datetime import datetime
+from itertools import count
+from uuid import UUID
+
+import pytest
 
 from icl.core import (
     IntelligenceAsset,
+    AssetStatus,
     DepreciationMethod,
-    calculate_depreciation
+    calculate_depreciation,
+    calculate_depreciation_batch
 )
 
 
-class TestDepreciation(unittest.TestCase):
-    def test_linear_depreciation(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
-
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date)
-
-        # 6 months of linear depreciation on $10k over 12 months
-        expected_depreciation = 10000.0 * (6 / 12)
-        self.assertAlmostEqual(depreciation_amount, expected_depreciation)
-        self.assertAlmostEqual(new_value, 5000.0)
-
-    def test_declining_balance_depreciation(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.DECLINING_BALANCE,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
-
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date)
-
-        # Should be more than linear due to declining balance
-        self.assertGreater(depreciation_amount, 5000.0)  # Linear would be $5000
-        self.assertLess(new_value, 5000.0)  # Value should be less than half
-
-    def test_zero_months(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
-
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 1, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date)
-
-        self.assertEqual(depreciation_amount, 0.0)
-        self.assertEqual(new_value, 10000.0)
-
-    def test_negative_months(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
+# Deterministic sequential IDs; the tests only rely on uniqueness
+_ids = count(1)
+
+
+def _uuid() -> UUID:
+    return UUID(int=next(_ids))
+
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+LINEAR = DepreciationMethod.LINEAR
+DECLINING = DepreciationMethod.DECLINING_BALANCE
+
+
+@pytest.fixture(scope="module")
+def base_asset():
+    # Depreciation never mutates its input, so one template asset is shared
+    # and per-case variants are derived with dataclasses.replace
+    return IntelligenceAsset(
+        asset_id=_uuid(),
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=LINEAR,
+        useful_life_months=12,
+        created_at=_NOW
+    )
+
+
+# Linear, zero-month and negative-month results are exactly representable
+# doubles and are compared with ==; only the declining-balance powers of
+# 5/6 are non-terminating and need pytest.approx
+@pytest.mark.parametrize("method,start,end,salvage,expected_dep,expected_val", [
+    # 6 months of linear depreciation on $10k over 12 months
+    pytest.param(LINEAR, datetime(2023, 1, 1), datetime(2023, 6, 1), 0.0,
+                 10000.0 * (6 / 12), 5000.0, id="linear"),
+    # Declining balance front-loads depreciation: more than the $5000 linear figure
+    pytest.param(DECLINING, datetime(2023, 1, 1), datetime(2023, 6, 1), 0.0,
+                 pytest.approx(10000.0 * (1 - (5 / 6) ** 5)), pytest.approx(10000.0 * (5 / 6) ** 5),
+                 id="declining_balance"),
+    pytest.param(LINEAR, datetime(2023, 1, 1), datetime(2023, 1, 1), 0.0,
+                 0.0, 10000.0, id="zero_months"),
+    pytest.param(LINEAR, datetime(2023, 6, 1), datetime(2023, 1, 1), 0.0,
+                 0.0, 10000.0, id="negative_months"),
+    # 6 months of linear depreciation on $9k (after salvage) over 12 months
+    pytest.param(LINEAR, datetime(2023, 1, 1), datetime(2023, 6, 1), 1000.0,
+                 9000.0 * (6 / 12), 1000.0 + 9000.0 * (6 / 12), id="linear_with_salvage_value"),
+    # Salvage is not reached within 5 months, so it only floors the new value
+    pytest.param(DECLINING, datetime(2023, 1, 1), datetime(2023, 6, 1), 1000.0,
+                 pytest.approx(10000.0 * (1 - (5 / 6) ** 5)), pytest.approx(10000.0 * (5 / 6) ** 5),
+                 id="declining_balance_with_salvage_value"),
+    # 24 months at 2/12 per month crosses salvage, so the full base is written off
+    pytest.param(DECLINING, datetime(2023, 1, 1), datetime(2025, 1, 1), 1000.0,
+                 pytest.approx(9000.0), pytest.approx(1000.0), id="declining_balance_reaches_salvage_value"),
+])
+def test_calculate_depreciation(base_asset, method, start, end, salvage, expected_dep, expected_val):
+    asset = replace(base_asset, depreciation_method=method)
+
+    depreciation_amount, new_value = calculate_depreciation(asset, start, end, salvage_value=salvage)
+
+    assert depreciation_amount == expected_dep
+    assert new_value == expected_val
+
+
+def test_batch_matches_single_asset_calculation(base_asset):
+    assets = [
+        replace(
+            base_asset,
+            initial_value=initial_value,
+            depreciation_method=method,
+            useful_life_months=useful_life_months,
+            current_value=current_value
         )
-
-        start_date = datetime(2023, 6, 1)
-        end_date = datetime(2023, 1, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date)
-
-        self.assertEqual(depreciation_amount, 0.0)
-        self.assertEqual(new_value, 10000.0)
-
-    def test_linear_with_salvage_value(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
-
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date, salvage_value=1000.0)
-
-        # 6 months of linear depreciation on $9k (after salvage) over 12 months
-        expected_depreciation = 9000.0 * (6 / 12)
-        self.assertAlmostEqual(depreciation_amount, expected_depreciation)
-        self.assertAlmostEqual(new_value, 1000.0 + expected_depreciation)
-
-    def test_declining_balance_with_salvage_value(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.DECLINING_BALANCE,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
-
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-
-        depreciation_amount, new_value = calculate_depreciation(asset, start_date, end_date, salvage_value=1000.0)
-
-        # Should be more than linear due to declining balance
-        self.assertGreater(depreciation_amount, 0.0)
-        self.assertLess(new_value, 10000.0)  # Value should be less than initial
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        for method in DepreciationMethod
+        for initial_value, useful_life_months, current_value in [
+            (10000.0, 12, None),
+            (10000.0, 12, 8000.0),
+            (50000.0, 60, None),
+            (2000.0, 2, None),
+        ]
+    ]
+
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2024, 6, 1)
+
+    amounts, new_values = calculate_depreciation_batch(assets, start_date, end_date, salvage_value=1000.0)
+
+    for asset, amount, new_value in zip(assets, amounts, new_values):
+        expected_amount, expected_value = calculate_depreciation(asset, start_date, end_date, salvage_value=1000.0)
+        assert amount == pytest.approx(expected_amount)
+        assert new_value == pytest.approx(expected_value)
+
+
+def test_rejects_non_depreciation_method_enum(base_asset):
+    # AssetStatus.ACTIVE == DepreciationMethod.LINEAR as IntEnums, but is not a method
+    asset = replace(base_asset, depreciation_method=AssetStatus.ACTIVE)
+
+    with pytest.raises(ValueError):
+        calculate_depreciation(asset, datetime(2023, 1, 1), datetime(2023, 6, 1))
+    with pytest.raises(ValueError):
+        calculate_depreciation_batch([asset], datetime(2023, 1, 1), datetime(2023, 6, 1))
@@ -1,97 +1,188 @@
-import unittest
-from uuid import UUID, uuid4
+from itertools import count
+from uuid import UUID
 
-from icl.core import IntegrationAdapter, ICAEAttribution
+import numpy as np
+import pytest
+
+from icl.core import IntegrationAdapter, ICAEAttribution, CapitalEvent, FINANCIAL_EVENT_DTYPE
+from icl.core.integration import _to_event_records
 from datetime import datetime
 
 
-class TestIntegration(unittest.TestCase):
-    def setUp(self):
-        self.adapter = IntegrationAdapter()
-
-    def test_consume_icae_attribution(self):
-        attribution_data = {
-            "asset_1": {"inference_cost": 1000.0, "execution_time": 3600},
-            "asset_2": {"inference_cost": 2000.0, "execution_time": 7200}
-        }
-
-        self.adapter.consume_icae_attribution(attribution_data)
-
-        self.assertEqual(self.adapter.icae_data, attribution_data)
-
-    def test_validate_attribution_exists(self):
-        asset_id = str(uuid4())
-        attribution_data = {
-            asset_id: {"inference_cost": 1000.0, "execution_time": 3600}
-        }
-        self.adapter.consume_icae_attribution(attribution_data)
-
-        result = self.adapter.validate_attribution(UUID(asset_id), {})
-        self.assertTrue(result)
-
-    def test_validate_attribution_missing(self):
-        asset_id = str(uuid4())
-        attribution_data = {
-            "other_asset": {"inference_cost": 1000.0, "execution_time": 3600}
-        }
-        self.adapter.consume_icae_attribution(attribution_data)
-
-        result = self.adapter.validate_attribution(UUID(asset_id), {})
-        self.assertFalse(result)
-
-    def test_get_execution_attribution(self):
-        asset_id = str(uuid4())
-        attribution_data = {
-            asset_id: {"inference_cost": 1000.0, "execution_time": 3600}
-        }
-        self.adapter.consume_icae_attribution(attribution_data)
-
-        result = self.adapter.get_execution_attribution(UUID(asset_id))
-        self.assertEqual(result, {"inference_cost": 1000.0, "execution_time": 3600})
-
-    def test_get_execution_attribution_missing(self):
-        asset_id = str(uuid4())
-        attribution_data = {
-            "other_asset": {"inference_cost": 1000.0, "execution_time": 3600}
-        }
-        self.adapter.consume_icae_attribution(attribution_data)
-
-        result = self.adapter.get_execution_attribution(UUID(asset_id))
-        self.assertIsNone(result)
-        
-    def test_pydantic_validation(self):
-        # Test that Pydantic validation works
-        attribution_data = {
-            "asset_1": {
-                "asset_id": "asset_1",
-                "inference_cost": 1000.0,
-                "execution_time": 3600.0,
-                "timestamp": datetime.now(),
-                "model_version": "v1.0"
-            }
-        }
-        
-        self.adapter.consume_icae_attribution(attribution_data)
-        
-        # Should have validated data
-        self.assertIn("asset_1", self.adapter.icae_data)
-        self.assertIsInstance(self.adapter.icae_data["asset_1"], ICAEAttribution)
-        
-    def test_pydantic_validation_error(self):
-        # Test that invalid data raises error
-        attribution_data = {
-            "asset_1": {
-                "asset_id": "asset_1",
-                "inference_cost": -1000.0,  # Invalid negative cost
-                "execution_time": 3600.0,
-                "timestamp": datetime.now(),
-                "model_version": "v1.0"
-            }
-        }
-        
-        with self.assertRaises(ValueError):
-            self.adapter.consume_icae_attribution(attribution_data)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+# Deterministic sequential IDs; the tests only rely on uniqueness
+_ids = count(1)
+
+
+def _uuid() -> UUID:
+    return UUID(int=next(_ids))
+
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+# Valid attribution payload; tests derive variants with {**_VALID_TEMPLATE, ...}
+_VALID_TEMPLATE = {
+    "asset_id": "asset_1",
+    "inference_cost": 1000.0,
+    "execution_time": 3600.0,
+    "timestamp": _NOW,
+    "model_version": "v1.0"
+}
+
+
+def _trusted_attribution(asset_id: str, **overrides) -> ICAEAttribution:
+    """Build attribution directly; Struct construction skips msgspec validation."""
+    return ICAEAttribution(**{**_VALID_TEMPLATE, "asset_id": asset_id, **overrides})
+
+
+@pytest.fixture
+def adapter():
+    return IntegrationAdapter()
+
+
+def test_consume_icae_attribution(adapter):
+    attribution_data = {
+        "asset_1": {"inference_cost": 1000.0, "execution_time": 3600},
+        "asset_2": {"inference_cost": 2000.0, "execution_time": 7200}
+    }
+
+    adapter.consume_icae_attribution(attribution_data)
+
+    assert adapter.icae_data == attribution_data
+
+
+def test_validate_attribution_exists(adapter):
+    asset_id = _uuid()
+    adapter.icae_data[asset_id] = _trusted_attribution(str(asset_id))
+
+    result = adapter.validate_attribution(asset_id, {})
+    assert result
+
+
+def test_validate_attribution_missing(adapter):
+    asset_id = _uuid()
+    adapter.icae_data["other_asset"] = _trusted_attribution("other_asset")
+
+    result = adapter.validate_attribution(asset_id, {})
+    assert not result
+
+
+def test_get_execution_attribution(adapter):
+    asset_id = _uuid()
+    adapter.icae_data[asset_id] = _trusted_attribution(str(asset_id))
+
+    result = adapter.get_execution_attribution(asset_id)
+    assert result.inference_cost == 1000.0
+    assert result.execution_time == 3600.0
+
+
+def test_get_execution_attribution_missing(adapter):
+    asset_id = _uuid()
+    adapter.icae_data["other_asset"] = _trusted_attribution("other_asset")
+
+    result = adapter.get_execution_attribution(asset_id)
+    assert result is None
+
+
+def test_schema_validation(adapter):
+    # Test that msgspec schema validation works
+    attribution_data = {"asset_1": _VALID_TEMPLATE}
+    
+    adapter.consume_icae_attribution(attribution_data)
+    
+    # Should have validated data
+    assert "asset_1" in adapter.icae_data
+    assert isinstance(adapter.icae_data["asset_1"], ICAEAttribution)
+
+
+def test_schema_validation_error(adapter):
+    # Test that invalid data raises error
+    attribution_data = {
+        "asset_1": {**_VALID_TEMPLATE, "inference_cost": -1000.0}  # Invalid negative cost
+    }
+    
+    with pytest.raises(ValueError):
+        adapter.consume_icae_attribution(attribution_data)
+
+
+def test_attribution_keyed_by_uuid(adapter):
+    asset_id = _uuid()
+    attribution_data = {
+        str(asset_id): {**_VALID_TEMPLATE, "asset_id": str(asset_id)}
+    }
+    adapter.consume_icae_attribution(attribution_data)
+
+    assert asset_id in adapter.icae_data
+    assert adapter.validate_attribution(asset_id, {})
+    assert adapter.get_execution_attribution(asset_id).inference_cost == 1000.0
+
+
+def test_attribution_lookup_by_string_id(adapter):
+    asset_id = _uuid()
+    adapter.consume_icae_attribution({str(asset_id): {**_VALID_TEMPLATE, "asset_id": str(asset_id)}})
+
+    assert adapter.validate_attribution(str(asset_id), {})
+    assert adapter.get_execution_attribution(str(asset_id)).inference_cost == 1000.0
+    assert not adapter.validate_attribution(str(_uuid()), {})
+
+
+def test_emit_to_financial_system_batch(adapter):
+    events = [
+        CapitalEvent(
+            event_id=_uuid(),
+            asset_id=_uuid(),
+            event_type="utilization",
+            timestamp=_NOW,
+            details={"amount": 500.0}
+        ),
+        CapitalEvent(
+            event_id=_uuid(),
+            asset_id=_uuid(),
+            event_type="retirement",
+            timestamp=_NOW,
+            details={}
+        )
+    ]
+
+    assert adapter.emit_to_financial_system(events)
+    assert adapter.emit_to_financial_system(np.zeros(2, dtype=FINANCIAL_EVENT_DTYPE))
+
+    with pytest.raises(ValueError):
+        adapter.emit_to_financial_system(np.zeros(2, dtype=np.float64))
+
+
+def test_event_records_with_non_numeric_amount(adapter):
+    # record_event accepts non-numeric amounts, so emitting them must too
+    events = [
+        CapitalEvent(
+            event_id=_uuid(),
+            asset_id=_uuid(),
+            event_type="utilization",
+            timestamp=_NOW,
+            details={"amount": amount}
+        )
+        for amount in (500.0, "n/a")
+    ]
+
+    assert adapter.emit_to_financial_system(events)
+
+    records = _to_event_records(events)
+    assert records["amount"][0] == 500.0
+    assert np.isnan(records["amount"][1])
+
+
+@pytest.mark.parametrize("timestamp, expected", [
+    ("2024-01-01", datetime(2024, 1, 1)),
+    ("2024-01-01T12:00", _NOW),
+    (_NOW.date(), datetime(2024, 1, 1)),
+    (_NOW.isoformat(), _NOW),
+])
+def test_schema_validation_timestamp_forms(adapter, timestamp, expected):
+    adapter.consume_icae_attribution({"asset_1": {**_VALID_TEMPLATE, "timestamp": timestamp}})
+
+    assert adapter.icae_data["asset_1"].timestamp == expected
+
+
+def test_schema_validation_invalid_timestamp(adapter):
+    with pytest.raises(ValueError):
+        adapter.consume_icae_attribution({"asset_1": {**_VALID_TEMPLATE, "timestamp": "2024-13-01"}})
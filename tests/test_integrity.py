@@ -1,204 +1,385 @@
-import unittest
-from datetime import datetime
-from uuid import uuid4
+import warnings
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from uuid import UUID
+
+import pytest
 
 from icl.core import (
     IntelligenceCapitalLedger,
     IntegrityChecker,
+    IntelligenceCapitalLifecycle,
     IntegrityError,
     IntelligenceAsset,
+    CapitalEvent,
     DepreciationMethod
 )
 
 
-class TestIntegrity(unittest.TestCase):
-    def setUp(self):
-        self.ledger = IntelligenceCapitalLedger()
-        self.checker = IntegrityChecker(self.ledger)
+# Deterministic sequential IDs; the tests only rely on uniqueness
+_ids = count(1)
 
-    def test_validate_asset_valid(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
 
-        try:
-            self.checker.validate_asset(asset)
-        except IntegrityError:
-            self.fail("Valid asset should not raise IntegrityError")
+def _uuid() -> UUID:
+    return UUID(int=next(_ids))
 
-    def test_validate_asset_no_owner(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
 
-        with self.assertRaises(IntegrityError):
-            self.checker.validate_asset(asset)
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-    def test_validate_asset_negative_value(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=-1000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
 
-        with self.assertRaises(IntegrityError):
-            self.checker.validate_asset(asset)
+@pytest.fixture(scope="module")
+def base_asset():
+    # Template for the standalone-asset validation tests; variants are
+    # derived with dataclasses.replace so the template is never mutated
+    return IntelligenceAsset(
+        asset_id=_uuid(),
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12,
+        created_at=_NOW
+    )
 
-    def test_validate_asset_zero_value(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=0.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
-        )
 
-        with self.assertRaises(IntegrityError):
-            self.checker.validate_asset(asset)
+@pytest.fixture
+def ledger():
+    return IntelligenceCapitalLedger()
 
-    def test_validate_asset_negative_useful_life(self):
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=-12,
-            created_at=datetime.now()
-        )
 
-        with self.assertRaises(IntegrityError):
-            self.checker.validate_asset(asset)
+@pytest.fixture
+def checker(ledger):
+    return IntegrityChecker(ledger)
+
+
+def test_validate_asset_valid(base_asset, checker):
+    asset = base_asset
+
+    try:
+        checker.validate_asset(asset)
+    except IntegrityError:
+        pytest.fail("Valid asset should not raise IntegrityError")
 
-    def test_validate_event_valid(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        event = self.ledger.events[0] if self.ledger.events else None
+def test_validate_asset_no_owner(base_asset, checker):
+    asset = replace(base_asset, owner="")
 
-        try:
-            self.checker.validate_event(event)
-        except IntegrityError:
-            self.fail("Valid event should not raise IntegrityError")
+    with pytest.raises(IntegrityError):
+        checker.validate_asset(asset)
 
-    def test_validate_entry_valid(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
+
+def test_validate_asset_negative_value(base_asset, checker):
+    asset = replace(base_asset, initial_value=-1000.0)
+
+    with pytest.raises(IntegrityError):
+        checker.validate_asset(asset)
+
+
+def test_validate_asset_zero_value(base_asset, checker):
+    asset = replace(base_asset, initial_value=0.0)
+
+    with pytest.raises(IntegrityError):
+        checker.validate_asset(asset)
+
+
+def test_validate_asset_negative_useful_life(base_asset, checker):
+    asset = replace(base_asset, useful_life_months=-12)
+
+    with pytest.raises(IntegrityError):
+        checker.validate_asset(asset)
+
+
+def test_validate_event_valid(ledger, checker):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = ledger.events[0] if ledger.events else None
+
+    try:
+        checker.validate_event(event)
+    except IntegrityError:
+        pytest.fail("Valid event should not raise IntegrityError")
+
+
+def test_validate_entry_valid(ledger, checker):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = ledger.events[0] if ledger.events else None
+
+    try:
+        checker.validate_entry(ledger.entries[0])
+    except IntegrityError:
+        pytest.fail("Valid entry should not raise IntegrityError")
+
+
+def test_check_all_integrity_no_errors(ledger, checker):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    errors = checker.check_all_integrity()
+    assert len(errors) == 0
+
+
+def test_check_all_integrity_with_errors(base_asset, ledger, checker):
+    # Create an invalid asset
+    asset = replace(base_asset, owner="", initial_value=-1000.0)
+    ledger.assets[asset.asset_id] = asset
+
+    errors = checker.check_all_integrity()
+    assert len(errors) > 0
+
+
+def test_check_all_integrity_sees_changes_to_existing_assets(ledger, checker):
+    mutated_id, replaced_id = _uuid(), _uuid()
+    for asset_id in (mutated_id, replaced_id):
+        ledger.create_asset(
             asset_id=asset_id,
             owner="team-alpha",
             initial_value=10000.0,
             depreciation_method=DepreciationMethod.LINEAR,
             useful_life_months=12
         )
+    assert checker.check_all_integrity() == []
+
+    # Mutate one asset in place and replace the other under the same key
+    ledger.assets[mutated_id].useful_life_months = 0
+    ledger.assets[replaced_id] = replace(ledger.assets[replaced_id], initial_value=-5.0)
+
+    assert checker.check_all_integrity() == [
+        f"Asset {mutated_id}: Useful life must be positive",
+        f"Asset {replaced_id}: Initial value must be positive"
+    ]
 
-        event = self.ledger.events[0] if self.ledger.events else None
 
-        try:
-            self.checker.validate_entry(self.ledger.entries[0])
-        except IntegrityError:
-            self.fail("Valid entry should not raise IntegrityError")
+def test_check_all_integrity_with_recorded_events(ledger, checker):
+    lifecycle = IntelligenceCapitalLifecycle(ledger)
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    lifecycle.utilize(asset_id, 500.0)
+    lifecycle.allocate(asset_id, "team-beta")
+    lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 6, 30))
 
-    def test_check_all_integrity_no_errors(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
+    assert checker.check_all_integrity() == []
+
+    # An invalid asset created through the ledger is still reported
+    bad_asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=bad_asset_id,
+        owner="team-alpha",
+        initial_value=-1000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    errors = checker.check_all_integrity()
+    assert errors == [f"Asset {bad_asset_id}: Initial value must be positive"]
+
+
+def test_check_all_integrity_reports_records_of_deleted_asset(ledger, checker):
+    lifecycle = IntelligenceCapitalLifecycle(ledger)
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    event = lifecycle.utilize(asset_id, 500.0)
+
+    del ledger.assets[asset_id]
+
+    assert checker.check_all_integrity() == [
+        f"Event {event.event_id}: Unknown asset {asset_id}",
+        f"Entry {ledger.entries[0].entry_id}: Unknown asset {asset_id}"
+    ]
+
+
+def test_check_all_integrity_with_timezone_aware_timestamps(ledger, checker):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    def record(timestamp):
+        ledger.record_event(CapitalEvent(
+            event_id=_uuid(),
             asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
+            event_type="utilization",
+            timestamp=timestamp,
+            details={"amount": 500.0}
+        ))
+
+    # Aware timestamps are recorded without warnings and compare as usual
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record(_NOW.replace(tzinfo=timezone.utc))
+        record(_NOW.replace(tzinfo=timezone.utc) + timedelta(seconds=1))
+    assert len(ledger.events) == len(ledger.entries) == 2
+    assert checker.check_all_integrity() == []
+
+    # Mixing in a naive timestamp fails the same way a direct comparison does
+    record(_NOW)
+    with pytest.raises(TypeError):
+        checker.check_all_integrity()
+
+
+def test_validate_depreciation_period_between_existing_periods(ledger, checker):
+    asset_id = _uuid()
+    lifecycle = IntelligenceCapitalLifecycle(ledger)
+
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=24
+    )
+
+    # Record periods out of chronological order, leaving a gap in between
+    lifecycle.depreciate(asset_id, datetime(2023, 7, 1), datetime(2023, 9, 30))
+    lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 3, 31))
+
+    try:
+        checker.validate_depreciation_period(
+            asset_id,
+            datetime(2023, 4, 1),
+            datetime(2023, 6, 30)
         )
+    except IntegrityError:
+        pytest.fail("Period in the gap should not raise IntegrityError")
 
-        errors = self.checker.check_all_integrity()
-        self.assertEqual(len(errors), 0)
+    with pytest.raises(IntegrityError):
+        checker.validate_depreciation_period(
+            asset_id,
+            datetime(2023, 3, 31),
+            datetime(2023, 4, 30)
+        )
 
-    def test_check_all_integrity_with_errors(self):
-        # Create an invalid asset
-        asset = IntelligenceAsset(
-            asset_id=uuid4(),
-            owner="",
-            initial_value=-1000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12,
-            created_at=datetime.now()
+    with pytest.raises(IntegrityError):
+        checker.validate_depreciation_period(
+            asset_id,
+            datetime(2023, 5, 1),
+            datetime(2023, 7, 1)
         )
-        self.ledger.assets[asset.asset_id] = asset
-
-        errors = self.checker.check_all_integrity()
-        self.assertGreater(len(errors), 0)
-
-    def test_validate_depreciation_period_no_overlap(self):
-        from icl.core import IntelligenceCapitalLifecycle
-        
-        asset_id = uuid4()
-        ledger = IntelligenceCapitalLedger()
-        lifecycle = IntelligenceCapitalLifecycle(ledger)
-        
-        lifecycle.capitalize(
+
+
+def test_validate_depreciation_period_after_inverted_period(ledger):
+    asset_id = _uuid()
+    lifecycle = IntelligenceCapitalLifecycle(ledger)
+
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=24
+    )
+
+    lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 3, 31))
+    # depreciate accepts an inverted period; it sorts after the first but ends before it
+    lifecycle.depreciate(asset_id, datetime(2023, 5, 1), datetime(2022, 12, 1))
+
+    with pytest.raises(IntegrityError):
+        lifecycle.depreciate(asset_id, datetime(2023, 2, 1), datetime(2023, 6, 1))
+
+
+def test_validate_depreciation_period_with_overlapping_recorded_periods(ledger, checker):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=24
+    )
+
+    # record_event does not reject overlaps, so a short period can sit inside
+    # a long one; periods given as ISO strings are indexed the same way
+    for start, end in [
+        ("2023-01-01T00:00:00", "2023-12-31T00:00:00"),
+        (datetime(2023, 2, 1), datetime(2023, 2, 28)),
+    ]:
+        ledger.record_event(CapitalEvent(
+            event_id=_uuid(),
             asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
+            event_type="depreciation",
+            timestamp=_NOW,
+            details={"amount": 100.0, "start_date": start, "end_date": end}
+        ))
+
+    with pytest.raises(IntegrityError):
+        checker.validate_depreciation_period(asset_id, datetime(2023, 6, 1), datetime(2023, 6, 30))
+
+
+@pytest.fixture(scope="class")
+def depreciated_ledger():
+    # Built once for the class: these tests only read the depreciation history
+    asset_id = _uuid()
+    ledger = IntelligenceCapitalLedger()
+    lifecycle = IntelligenceCapitalLifecycle(ledger)
+
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    # Record first depreciation period
+    lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 6, 30))
 
-        # Record first depreciation period
-        lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 6, 30))
+    return ledger, IntegrityChecker(ledger), asset_id
+
+
+class TestDepreciationPeriodOverlap:
+    def test_validate_depreciation_period_no_overlap(self, depreciated_ledger):
+        _, checker, asset_id = depreciated_ledger
 
         # Test that no overlap is detected when there's none
-        try:
-            self.checker.validate_depreciation_period(
-                asset_id, 
-                datetime(2023, 7, 1), 
-                datetime(2023, 12, 31)
-            )
-        except IntegrityError:
-            self.fail("Valid period should not raise IntegrityError")
-            
-    def test_validate_depreciation_period_with_overlap(self):
-        from icl.core import IntelligenceCapitalLifecycle
-        
-        asset_id = uuid4()
-        ledger = IntelligenceCapitalLedger()
-        lifecycle = IntelligenceCapitalLifecycle(ledger)
-        
-        lifecycle.capitalize(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
+        checker.validate_depreciation_period(
+            asset_id,
+            datetime(2023, 7, 1),
+            datetime(2023, 12, 31)
         )
-        
-        # Record first depreciation
-        lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 6, 30))
-        
+
+    def test_validate_depreciation_period_with_overlap(self, depreciated_ledger):
+        _, checker, asset_id = depreciated_ledger
+
         # Try to depreciate overlapping period - should fail
-        with self.assertRaises(IntegrityError):
-            self.checker.validate_depreciation_period(
-                asset_id, 
+        with pytest.raises(IntegrityError):
+            checker.validate_depreciation_period(
+                asset_id,
                 datetime(2023, 6, 1),  # Overlaps with previous period
                 datetime(2023, 12, 31)
             )
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
@@ -1,198 +1,437 @@
-import unittest
+import copy
+import json
+import math
+import pickle
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from uuid import UUID, uuid4
+from itertools import count
+from typing import List
+from uuid import UUID
+
+import pytest
 
 from icl.core import (
     IntelligenceCapitalLedger,
     IntelligenceAsset,
     CapitalEvent,
     AssetStatus,
-    DepreciationMethod
+    DepreciationMethod,
+    JournalEntry,
+    AccountType
 )
 
 
-class TestIntelligenceCapitalLedger(unittest.TestCase):
-    def setUp(self):
-        self.ledger = IntelligenceCapitalLedger()
+# Deterministic sequential IDs; the tests only rely on uniqueness
+_ids = count(1)
 
-    def test_create_asset(self):
-        asset_id = uuid4()
-        asset = self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        self.assertEqual(asset.asset_id, asset_id)
-        self.assertEqual(asset.owner, "team-alpha")
-        self.assertEqual(asset.initial_value, 10000.0)
-        self.assertEqual(asset.depreciation_method, DepreciationMethod.LINEAR)
-        self.assertEqual(asset.useful_life_months, 12)
-        self.assertEqual(asset.status, AssetStatus.ACTIVE)
-        self.assertEqual(asset.current_value, 10000.0)
-
-    def test_create_duplicate_asset(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
+def _uuid() -> UUID:
+    return UUID(int=next(_ids))
+
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-        with self.assertRaises(ValueError):
-            self.ledger.create_asset(
-                asset_id=asset_id,
-                owner="team-beta",
-                initial_value=5000.0,
-                depreciation_method=DepreciationMethod.LINEAR,
-                useful_life_months=12
-            )
-
-    def test_record_event(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        event = CapitalEvent(
-            event_id=uuid4(),
+def _mk_events(asset_id: UUID, n: int) -> List[CapitalEvent]:
+    """Build n utilization events for an asset, one second apart."""
+    return [
+        CapitalEvent(
+            event_id=_uuid(),
             asset_id=asset_id,
             event_type="utilization",
-            timestamp=datetime.now(),
-            details={"amount": 500.0}
+            timestamp=_NOW + timedelta(seconds=i),
+            details={"amount": float(i)}
         )
+        for i in range(n)
+    ]
 
-        self.ledger.record_event(event)
 
-        self.assertEqual(len(self.ledger.events), 1)
-        self.assertEqual(len(self.ledger.entries), 1)
+@pytest.fixture
+def ledger():
+    return IntelligenceCapitalLedger()
 
-    def test_get_asset(self):
-        asset_id = uuid4()
-        asset = self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        retrieved_asset = self.ledger.get_asset(asset_id)
-        self.assertEqual(retrieved_asset, asset)
+def test_create_asset(ledger):
+    asset_id = _uuid()
+    asset = ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    assert asset.asset_id == asset_id
+    assert asset.owner == "team-alpha"
+    assert asset.initial_value == 10000.0
+    assert asset.depreciation_method == DepreciationMethod.LINEAR
+    assert asset.useful_life_months == 12
+    assert asset.status == AssetStatus.ACTIVE
+    assert asset.current_value == 10000.0
 
-    def test_get_nonexistent_asset(self):
-        asset = self.ledger.get_asset(uuid4())
-        self.assertIsNone(asset)
 
-    def test_get_events_for_asset(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
+def test_create_duplicate_asset(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    with pytest.raises(ValueError):
+        ledger.create_asset(
             asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
+            owner="team-beta",
+            initial_value=5000.0,
             depreciation_method=DepreciationMethod.LINEAR,
             useful_life_months=12
         )
 
-        event1 = CapitalEvent(
-            event_id=uuid4(),
-            asset_id=asset_id,
-            event_type="utilization",
-            timestamp=datetime.now(),
-            details={"amount": 500.0}
-        )
 
-        event2 = CapitalEvent(
-            event_id=uuid4(),
-            asset_id=asset_id,
-            event_type="allocation",
-            timestamp=datetime.now(),
-            details={"from_owner": "team-alpha", "to_owner": "team-beta"}
-        )
+def test_record_event(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
 
-        self.ledger.record_event(event1)
-        self.ledger.record_event(event2)
+    event = CapitalEvent(
+        event_id=_uuid(),
+        asset_id=asset_id,
+        event_type="utilization",
+        timestamp=_NOW,
+        details={"amount": 500.0}
+    )
 
-        events = self.ledger.get_events_for_asset(asset_id)
-        self.assertEqual(len(events), 2)
+    ledger.record_event(event)
 
-    def test_get_entries_for_asset(self):
-        asset_id = uuid4()
-        self.ledger.create_asset(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
+    assert len(ledger.events) == 1
+    assert len(ledger.entries) == 1
 
-        event1 = CapitalEvent(
-            event_id=uuid4(),
-            asset_id=asset_id,
-            event_type="utilization",
-            timestamp=datetime.now(),
-            details={"amount": 500.0}
-        )
 
-        event2 = CapitalEvent(
-            event_id=uuid4(),
-            asset_id=asset_id,
-            event_type="allocation",
-            timestamp=datetime.now(),
-            details={"from_owner": "team-alpha", "to_owner": "team-beta"}
-        )
+def test_entry_metadata_shares_event_details_and_round_trips(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = CapitalEvent(
+        event_id=_uuid(),
+        asset_id=asset_id,
+        event_type="utilization",
+        timestamp=_NOW,
+        details={"amount": 500.0}
+    )
+    ledger.record_event(event)
+
+    entry = ledger.entries[0]
+    assert entry.metadata is event.details
+
+    # Entries stay picklable and copyable, so ledgers can be persisted
+    assert pickle.loads(pickle.dumps(entry)) == entry
+    assert copy.deepcopy(entry) == entry
+    assert asdict(entry)["metadata"] == event.details
+    restored = pickle.loads(pickle.dumps(ledger))
+    assert restored.entries == ledger.entries
+
+
+def test_now_is_strictly_increasing(ledger):
+    timestamps = [ledger.now() for _ in range(1000)]
+
+    assert all(a < b for a, b in zip(timestamps, timestamps[1:]))
+
+
+def test_get_asset(ledger):
+    asset_id = _uuid()
+    asset = ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
 
-        self.ledger.record_event(event1)
-        self.ledger.record_event(event2)
-
-        entries = self.ledger.get_entries_for_asset(asset_id)
-        self.assertEqual(len(entries), 2)
-        
-    def test_verify_journal_balance(self):
-        # Create a ledger with balanced journal entries
-        ledger = IntelligenceCapitalLedger()
-        
-        # Create an asset and record some events that should balance
-        asset_id = uuid4()
+    retrieved_asset = ledger.get_asset(asset_id)
+    assert retrieved_asset == asset
+
+
+def test_get_nonexistent_asset(ledger):
+    asset = ledger.get_asset(_uuid())
+    assert asset is None
+
+
+def test_get_events_for_asset(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    for event in _mk_events(asset_id, 2):
+        ledger.record_event(event)
+
+    events = ledger.get_events_for_asset(asset_id)
+    assert len(events) == 2
+
+
+def test_get_entries_for_asset(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    for event in _mk_events(asset_id, 2):
+        ledger.record_event(event)
+
+    entries = ledger.get_entries_for_asset(asset_id)
+    assert len(entries) == 2
+
+
+def test_get_event_amounts_for_asset(ledger):
+    asset_id = _uuid()
+    other_asset_id = _uuid()
+    for aid in (asset_id, other_asset_id):
         ledger.create_asset(
-            asset_id=asset_id,
+            asset_id=aid,
             owner="team-alpha",
             initial_value=10000.0,
             depreciation_method=DepreciationMethod.LINEAR,
             useful_life_months=12
         )
-        
-        # Verify balance is initially true (no entries)
-        self.assertTrue(ledger.verify_journal_balance())
-        
-    def test_export_audit_trail(self):
-        ledger = IntelligenceCapitalLedger()
-        asset_id = uuid4()
-        ledger.create_asset(
+
+    for aid, event_type, amount in [
+        (asset_id, "utilization", 500.0),
+        (other_asset_id, "utilization", 700.0),
+        (asset_id, "depreciation", 250.0),
+        (asset_id, "utilization", 125.0),
+    ]:
+        ledger.record_event(CapitalEvent(
+            event_id=_uuid(),
+            asset_id=aid,
+            event_type=event_type,
+            timestamp=_NOW,
+            details={"amount": amount}
+        ))
+
+    assert ledger.get_event_amounts_for_asset(asset_id).tolist() == [500.0, 250.0, 125.0]
+    assert ledger.get_event_amounts_for_asset(asset_id, "utilization").tolist() == [500.0, 125.0]
+    assert len(ledger.get_event_amounts_for_asset(asset_id, "retirement")) == 0
+    assert len(ledger.get_event_amounts_for_asset(_uuid())) == 0
+
+
+def test_get_event_amounts_for_directly_added_asset(ledger):
+    asset = IntelligenceAsset(
+        asset_id=_uuid(),
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12,
+        created_at=_NOW
+    )
+    ledger.assets[asset.asset_id] = asset
+
+    for event in _mk_events(asset.asset_id, 3):
+        ledger.record_event(event)
+
+    assert ledger.get_event_amounts_for_asset(asset.asset_id).tolist() == [0.0, 1.0, 2.0]
+
+    # An asset deleted and created again keeps its row, and so its amounts
+    del ledger.assets[asset.asset_id]
+    ledger.create_asset(
+        asset_id=asset.asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    assert ledger.get_event_amounts_for_asset(asset.asset_id).tolist() == [0.0, 1.0, 2.0]
+
+
+def test_record_event_with_non_numeric_amount(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    for amount in (500.0, "n/a", 125.0):
+        ledger.record_event(CapitalEvent(
+            event_id=_uuid(),
             asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
-        
-        # Test JSON export
-        json_export = ledger.export_audit_trail("json")
-        self.assertIsInstance(json_export, str)
-        self.assertTrue(len(json_export) > 0)
-        
-        # Test CSV export (should return empty string for now)
-        csv_export = ledger.export_audit_trail("csv")
-        self.assertIsInstance(csv_export, str)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+            event_type="utilization",
+            timestamp=_NOW,
+            details={"amount": amount}
+        ))
+
+    assert [entry.amount for entry in ledger.entries] == [500.0, "n/a", 125.0]
+    amounts = ledger.get_event_amounts_for_asset(asset_id)
+    assert amounts[[0, 2]].tolist() == [500.0, 125.0]
+    assert math.isnan(amounts[1])
+
+
+def _journal_entry(event_id: UUID) -> JournalEntry:
+    return JournalEntry(
+        entry_id=_uuid(),
+        event_id=event_id,
+        timestamp=_NOW,
+        debit_account=AccountType.DEPRECIATION_EXPENSE,
+        credit_account=AccountType.ACCUMULATED_DEPRECIATION,
+        amount=100.0,
+        description="Asset depreciation",
+        metadata={}
+    )
+
+
+def test_get_journal_entries_for_asset(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    events = _mk_events(asset_id, 2)
+    for event in events:
+        ledger.record_event(event)
+
+    journal_entries = [_journal_entry(event.event_id) for event in events]
+    for journal_entry in journal_entries:
+        ledger.record_journal_entry(journal_entry)
+    ledger.record_journal_entry(_journal_entry(_uuid()))  # Unrelated event
+
+    assert ledger.get_journal_entries_for_asset(asset_id) == journal_entries
+
+    # Entries appended without record_journal_entry are still found
+    direct_entry = _journal_entry(events[0].event_id)
+    ledger.journal_entries.append(direct_entry)
+    assert ledger.get_journal_entries_for_asset(asset_id) == journal_entries + [direct_entry]
+
+
+def test_getters_for_unknown_asset_do_not_grow_indexes(ledger):
+    asset_id = _uuid()
+
+    assert ledger.get_events_for_asset(asset_id) == []
+    assert ledger.get_entries_for_asset(asset_id) == []
+    assert ledger.get_depreciation_periods_for_asset(asset_id) == []
+    assert ledger.get_journal_entries_for_asset(asset_id) == []
+
+    assert asset_id not in ledger._events_by_asset
+    assert asset_id not in ledger._entries_by_asset
+    assert asset_id not in ledger._dep_periods_by_asset
+
+
+def test_verify_journal_balance():
+    # Create a ledger with balanced journal entries
+    ledger = IntelligenceCapitalLedger()
+    
+    # Create an asset and record some events that should balance
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    
+    # Verify balance is initially true (no entries)
+    assert ledger.verify_journal_balance()
+
+
+def test_verify_journal_balance_detects_non_positive_amount(ledger):
+    for amount in (100.0, 250.0, 0.0):
+        ledger.record_journal_entry(JournalEntry(
+            entry_id=_uuid(),
+            event_id=_uuid(),
+            timestamp=_NOW,
+            debit_account=AccountType.DEPRECIATION_EXPENSE,
+            credit_account=AccountType.ACCUMULATED_DEPRECIATION,
+            amount=amount,
+            description="Asset depreciation",
+            metadata={}
+        ))
+        assert ledger.verify_journal_balance() == (amount > 0)
+
+
+def test_verify_journal_balance_sees_directly_added_entries(ledger):
+    ledger.journal_entries.append(JournalEntry(
+        entry_id=_uuid(),
+        event_id=_uuid(),
+        timestamp=_NOW,
+        debit_account=AccountType.DEPRECIATION_EXPENSE,
+        credit_account=AccountType.ACCUMULATED_DEPRECIATION,
+        amount=-5.0,
+        description="Asset depreciation",
+        metadata={}
+    ))
+
+    assert not ledger.verify_journal_balance()
+
+
+def test_export_audit_trail():
+    ledger = IntelligenceCapitalLedger()
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    
+    # Test JSON export
+    json_export = ledger.export_audit_trail("json")
+    assert isinstance(json_export, str)
+    assert len(json_export) > 0
+    
+    # Test CSV export (should return empty string for now)
+    csv_export = ledger.export_audit_trail("csv")
+    assert isinstance(csv_export, str)
+
+
+def test_export_audit_trail_contents(ledger):
+    asset_id = _uuid()
+    ledger.create_asset(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    ledger.record_event(CapitalEvent(
+        event_id=_uuid(),
+        asset_id=asset_id,
+        event_type="utilization",
+        timestamp=_NOW,
+        details={"amount": 500.0}
+    ))
+    ledger.generate_proof(asset_id)
+
+    trail = json.loads(ledger.export_audit_trail("json"))
+
+    assert trail["assets"][0]["asset_id"] == str(asset_id)
+    assert trail["assets"][0]["depreciation_method"] == DepreciationMethod.LINEAR.label
+    assert len(trail["events"]) == 1
+    assert len(trail["entries"]) == 1
+    assert trail["entries"][0]["amount"] == 500.0
+    assert len(trail["proofs"]) == 1
@@ -1,75 +1,174 @@
-import unittest
+import json
 from datetime import datetime
-from uuid import UUID, uuid4
+from itertools import count
+from uuid import UUID
+
+import pytest
 
 from icl.core import (
     IntelligenceCapitalLedger,
     IntelligenceCapitalLifecycle,
-    IntelligenceAsset,
-    CapitalEvent,
     AssetStatus,
-    DepreciationMethod
+    DepreciationMethod,
+    IntegrityError
 )
 
 
-class TestIntelligenceCapitalLifecycle(unittest.TestCase):
-    def setUp(self):
-        self.ledger = IntelligenceCapitalLedger()
-        self.lifecycle = IntelligenceCapitalLifecycle(self.ledger)
+# Deterministic sequential IDs; the tests only rely on uniqueness
+_ids = count(1)
 
-    def test_capitalize(self):
-        asset_id = uuid4()
-        asset = self.lifecycle.capitalize(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        self.assertEqual(asset.asset_id, asset_id)
-        self.assertEqual(asset.owner, "team-alpha")
-        self.assertEqual(asset.initial_value, 10000.0)
-        self.assertEqual(asset.status, AssetStatus.ACTIVE)
+def _uuid() -> UUID:
+    return UUID(int=next(_ids))
 
-    def test_allocate(self):
-        asset_id = uuid4()
-        self.lifecycle.capitalize(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
 
-        event = self.lifecycle.allocate(asset_id, "team-beta")
+@pytest.fixture
+def ledger():
+    return IntelligenceCapitalLedger()
 
-        # Verify that the asset's owner was updated
-        asset = self.ledger.get_asset(asset_id)
-        self.assertEqual(asset.owner, "team-beta")
-        
-        self.assertEqual(event.event_type, "allocation")
-        self.assertEqual(event.details["from_owner"], "team-alpha")
-        self.assertEqual(event.details["to_owner"], "team-beta")
 
-    def test_utilize(self):
-        asset_id = uuid4()
-        self.lifecycle.capitalize(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
+@pytest.fixture
+def lifecycle(ledger):
+    return IntelligenceCapitalLifecycle(ledger)
 
-        event = self.lifecycle.utilize(asset_id, 500.0)
 
-        self.assertEqual(event.event_type, "utilization")
-        self.assertEqual(event.details["amount"], 500.0)
+def test_capitalize(lifecycle):
+    asset_id = _uuid()
+    asset = lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
 
-    def test_depreciate(self):
-        asset_id = uuid4()
-        self.lifecycle.capitalize(
+    assert asset.asset_id == asset_id
+    assert asset.owner == "team-alpha"
+    assert asset.initial_value == 10000.0
+    assert asset.status == AssetStatus.ACTIVE
+
+
+def test_allocate(ledger, lifecycle):
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = lifecycle.allocate(asset_id, "team-beta")
+
+    # Verify that the asset's owner was updated
+    asset = ledger.get_asset(asset_id)
+    assert asset.owner == "team-beta"
+    
+    assert event.event_type == "allocation"
+    assert event.details["from_owner"] == "team-alpha"
+    assert event.details["to_owner"] == "team-beta"
+
+
+def test_utilize(lifecycle):
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = lifecycle.utilize(asset_id, 500.0)
+
+    assert event.event_type == "utilization"
+    assert event.details["amount"] == 500.0
+
+
+def test_depreciate(lifecycle):
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 6, 1)
+
+    event = lifecycle.depreciate(asset_id, start_date, end_date)
+
+    assert event.event_type == "depreciation"
+    assert "amount" in event.details
+    assert event.details["start_date"] == start_date
+    assert event.details["end_date"] == end_date
+
+
+def test_depreciation_period_exported_as_iso_dates(ledger, lifecycle):
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    lifecycle.depreciate(asset_id, datetime(2023, 1, 1), datetime(2023, 6, 1))
+
+    trail = json.loads(ledger.export_audit_trail("json"))
+
+    for details in (trail["events"][-1]["details"], trail["journal_entries"][-1]["metadata"]):
+        assert (details["start_date"], details["end_date"]) == ("2023-01-01T00:00:00", "2023-06-01T00:00:00")
+
+
+def test_retire(ledger, lifecycle):
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+
+    event = lifecycle.retire(asset_id)
+
+    assert event.event_type == "retirement"
+    asset = ledger.get_asset(asset_id)
+    assert asset.status == AssetStatus.RETIRED
+
+
+def test_journal_entries_created(ledger, lifecycle):
+    # Test that journal entries are created for all lifecycle events
+    asset_id = _uuid()
+    lifecycle.capitalize(
+        asset_id=asset_id,
+        owner="team-alpha",
+        initial_value=10000.0,
+        depreciation_method=DepreciationMethod.LINEAR,
+        useful_life_months=12
+    )
+    
+    # Check that capitalization created journal entries
+    journal_entries = ledger.get_journal_entries_for_asset(asset_id)
+    assert len(journal_entries) > 0
+    
+    # Test depreciation creates journal entries
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 6, 1)
+    lifecycle.depreciate(asset_id, start_date, end_date)
+    
+    # Should have more journal entries now
+    journal_entries_after = ledger.get_journal_entries_for_asset(asset_id)
+    assert len(journal_entries_after) > len(journal_entries)
+
+
+def test_depreciate_batch(ledger, lifecycle):
+    asset_ids = [_uuid(), _uuid()]
+    for asset_id in asset_ids:
+        lifecycle.capitalize(
             asset_id=asset_id,
             owner="team-alpha",
             initial_value=10000.0,
@@ -77,56 +176,46 @@ class TestIntelligenceCapitalLifecycle(unittest.TestCase):
             useful_life_months=12
         )
 
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-
-        event = self.lifecycle.depreciate(asset_id, start_date, end_date)
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 6, 1)
 
-        self.assertEqual(event.event_type, "depreciation")
-        self.assertIn("amount", event.details)
-        self.assertIn("start_date", event.details)
-        self.assertIn("end_date", event.details)
+    events = lifecycle.depreciate_batch(asset_ids, start_date, end_date)
 
-    def test_retire(self):
-        asset_id = uuid4()
-        self.lifecycle.capitalize(
-            asset_id=asset_id,
-            owner="team-alpha",
-            initial_value=10000.0,
-            depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
-        )
+    assert len(events) == 2
+    assert [e.asset_id for e in events] == asset_ids
+    for event in events:
+        assert event.event_type == "depreciation"
+        assert len(ledger.get_journal_entries_for_asset(event.asset_id)) == 1
 
-        event = self.lifecycle.retire(asset_id)
 
-        self.assertEqual(event.event_type, "retirement")
-        asset = self.ledger.get_asset(asset_id)
-        self.assertEqual(asset.status, AssetStatus.RETIRED)
-        
-    def test_journal_entries_created(self):
-        # Test that journal entries are created for all lifecycle events
-        asset_id = uuid4()
-        self.lifecycle.capitalize(
+def test_depreciate_batch_rejects_without_recording(ledger, lifecycle):
+    asset_ids = [_uuid(), _uuid()]
+    for asset_id, useful_life_months in zip(asset_ids, (12, 0)):
+        lifecycle.capitalize(
             asset_id=asset_id,
             owner="team-alpha",
             initial_value=10000.0,
             depreciation_method=DepreciationMethod.LINEAR,
-            useful_life_months=12
+            useful_life_months=useful_life_months
         )
-        
-        # Check that capitalization created journal entries
-        journal_entries = self.ledger.get_journal_entries_for_asset(asset_id)
-        self.assertGreater(len(journal_entries), 0)
-        
-        # Test depreciation creates journal entries
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 6, 1)
-        self.lifecycle.depreciate(asset_id, start_date, end_date)
-        
-        # Should have more journal entries now
-        journal_entries_after = self.ledger.get_journal_entries_for_asset(asset_id)
-        self.assertGreater(len(journal_entries_after), len(journal_entries))
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    valid_id, zero_life_id = asset_ids
+
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 6, 1)
+    lifecycle.depreciate(valid_id, start_date, end_date)
+    recorded = (len(ledger.events), len(ledger.journal_entries), ledger.get_asset(valid_id).current_value)
+
+    # A zero useful life, a repeated asset and an overlapping period are each
+    # rejected before any asset is depreciated
+    with pytest.raises(ValueError):
+        lifecycle.depreciate_batch([zero_life_id], start_date, end_date)
+    with pytest.raises(ValueError):
+        lifecycle.depreciate(zero_life_id, start_date, end_date)
+    with pytest.raises(ValueError):
+        lifecycle.depreciate_batch([valid_id, valid_id], datetime(2024, 1, 1), datetime(2024, 6, 1))
+    with pytest.raises(IntegrityError):
+        lifecycle.depreciate_batch([zero_life_id, valid_id], datetime(2023, 5, 1), datetime(2023, 9, 1))
+
+    assert (len(ledger.events), len(ledger.journal_entries), ledger.get_asset(valid_id).current_value) == recorded
+    assert ledger.get_asset(zero_life_id).current_value == 10000.0
+    assert ledger.verify_journal_balance()